@@ -15,8 +15,18 @@ import warnings
 from typing import Callable, List, Optional, Union
 
 import torch
-from botorch.utils.safe_math import log_fatmoid, logexpit
+from botorch.utils.safe_math import log_fatmoid
 from torch import Tensor
+from torch.nn.functional import logsigmoid
+
+try:
+    # have torch.einsum plan multi-operand contractions via opt_einsum, which
+    # caches contraction paths and avoids large intermediates; this benefits
+    # any einsum calls reachable from the objective/acquisition code paths
+    torch.backends.opt_einsum.enabled = True
+    torch.backends.opt_einsum.strategy = "auto"
+except AttributeError:  # pragma: no cover - torch versions without the backend
+    pass
 
 
 def get_objective_weights_transform(
@@ -46,11 +56,28 @@ def get_objective_weights_transform(
     if weights is None:
         return lambda Y: Y.squeeze(-1)
 
+    # ensure contiguous memory so that matmul dispatches straight to GEMV
+    weights = weights.detach().contiguous()
+
+    if weights.numel() == 1:
+        # for a single output, scaling by a scalar avoids the matmul dispatch
+        w = weights.item()
+
+        def _objective(Y: Tensor, X: Optional[Tensor] = None):
+            return w * Y.squeeze(-1)
+
+        return _objective
+
+    # cache device/dtype-aligned copies of the weights so that repeated calls
+    # from MC acquisition loops do not pay for the conversion each time
+    weights_cache = {}
+
     def _objective(Y: Tensor, X: Optional[Tensor] = None):
         r"""Evaluate objective.
 
-        Note: einsum multiples Y by weights and sums over the `m`-dimension.
-        Einsum is ~2x faster than using `(Y * weights.view(1, 1, -1)).sum(dim-1)`.
+        Note: matmul multiplies Y by weights and sums over the `m`-dimension,
+        dispatching directly to BLAS rather than going through einsum's
+        equation-parsing overhead.
 
         Args:
             Y: A `... x b x q x m` tensor of function values.
@@ -58,7 +85,12 @@ def get_objective_weights_transform(
         Returns:
             A `... x b x q`-dim tensor of objective values.
         """
-        return torch.einsum("...m, m", [Y, weights])
+        key = (Y.device, Y.dtype)
+        w = weights_cache.get(key)
+        if w is None:
+            w = weights.to(device=Y.device, dtype=Y.dtype, non_blocking=True)
+            weights_cache[key] = w
+        return Y.matmul(w)
 
     return _objective
 
@@ -68,6 +100,8 @@ def apply_constraints_nonnegative_soft(
     constraints: List[Callable[[Tensor], Tensor]],
     samples: Tensor,
     eta: Union[Tensor, float],
+    copy: bool = True,
+    shift: float = 0.0,
 ) -> Tensor:
     r"""Applies constraints to a non-negative objective.
 
@@ -86,6 +120,12 @@ def apply_constraints_nonnegative_soft(
             constraint in constraints. In case of a tensor the length of the tensor
             must match the number of provided constraints. The i-th constraint is
             then estimated with the i-th eta value.
+        copy: If True (default), leave `obj` untouched and operate on a copy.
+            Callers that own `obj` (e.g. `apply_constraints`) can pass False to
+            clamp in place and avoid materializing an intermediate tensor.
+        shift: A constant subtracted from the feasibility-weighted objective
+            before returning. Fusing the subtraction into the final in-place
+            pass saves `apply_constraints` a separate full-tensor op.
 
     Returns:
         A `n_samples x b x q (x m')`-dim tensor of feasibility-weighted objectives.
@@ -93,9 +133,46 @@ def apply_constraints_nonnegative_soft(
     w = compute_smoothed_feasibility_indicator(
         constraints=constraints, samples=samples, eta=eta
     )
-    if obj.dim() == samples.dim():
-        w = w.unsqueeze(-1)  # Need to unsqueeze to accommodate the outcome dimension.
-    return obj.clamp_min(0).mul(w)  # Enforce non-negativity of obj, apply constraints.
+    extra_dims = obj.dim() - w.dim()
+    if extra_dims:
+        # align w with any trailing outcome dimensions of obj up front; the
+        # explicit broadcast shape lets torch.compile specialize the multiply
+        w = w.view(*w.shape, *([1] * extra_dims))
+    # Enforce non-negativity of obj, apply constraints. The in-place multiply is
+    # safe in either case since the clamp on the copy path returns a fresh tensor.
+    obj = obj.clamp_min(0) if copy else obj.clamp_(min=0)
+    obj = obj.mul_(w)
+    return obj.sub_(shift) if shift else obj
+
+
+def _smoothed_feasibility_core(
+    cvals: Tensor, eta: Union[Tensor, float], log: bool, fat: bool
+) -> Tensor:
+    r"""Numeric core of `compute_smoothed_feasibility_indicator`.
+
+    Operates on pre-stacked constraint values and a broadcastable eta, so that
+    the whole chain of elementwise ops and the reduction can be compiled into
+    a single fused kernel.
+    """
+    log_sigmoid = log_fatmoid if fat else logsigmoid
+    is_feasible = log_sigmoid(-cvals / eta).sum(dim=0)
+    return is_feasible if log else is_feasible.exp()
+
+
+_compiled_smoothed_feasibility_core = None
+
+
+def _get_compiled_smoothed_feasibility_core():
+    r"""Lazily compile the smoothed feasibility core, falling back to eager."""
+    global _compiled_smoothed_feasibility_core
+    if _compiled_smoothed_feasibility_core is None:
+        try:
+            _compiled_smoothed_feasibility_core = torch.compile(
+                _smoothed_feasibility_core, fullgraph=False, dynamic=True
+            )
+        except Exception:  # pragma: no cover - torch.compile unavailable
+            _compiled_smoothed_feasibility_core = _smoothed_feasibility_core
+    return _compiled_smoothed_feasibility_core
 
 
 def compute_feasibility_indicator(
@@ -112,11 +189,12 @@ def compute_feasibility_indicator(
     Returns:
         A `batch_shape x q`-dim tensor of Boolean feasibility values.
     """
-    ind = torch.ones(samples.shape[:-1], dtype=torch.bool, device=samples.device)
-    if constraints is not None:
-        for constraint in constraints:
-            ind = ind.logical_and(constraint(samples) < 0)
-    return ind
+    if not constraints:
+        return torch.ones(samples.shape[:-1], dtype=torch.bool, device=samples.device)
+    # evaluating all constraints into one stacked tensor replaces the sequential
+    # logical_and carry with a single reduction over the constraint dimension
+    cvals = torch.stack([constraint(samples) for constraint in constraints], dim=0)
+    return cvals.lt(0).all(dim=0)
 
 
 def compute_smoothed_feasibility_indicator(
@@ -125,6 +203,7 @@ def compute_smoothed_feasibility_indicator(
     eta: Union[Tensor, float],
     log: bool = False,
     fat: bool = False,
+    compute_dtype: Optional[torch.dtype] = None,
 ) -> Tensor:
     r"""Computes the smoothed feasibility indicator of a list of constraints.
 
@@ -148,27 +227,72 @@ def compute_smoothed_feasibility_indicator(
             then estimated with the i-th eta value.
         log: Toggles the computation of the log-feasibility indicator.
         fat: Toggles the computation of the fat-tailed feasibility indicator.
+        compute_dtype: If provided, cast `samples` to this dtype before
+            evaluating the constraints and carry out the smoothing in that
+            precision, casting the result back to the dtype of `samples`.
+            Reduced precision (e.g. `torch.bfloat16`) halves memory bandwidth
+            and the smoothing itself has ample numerical headroom, but should
+            only be used if the constraint callables are safe to evaluate in
+            the reduced precision.
 
     Returns:
         A `n_samples x b x q`-dim tensor of feasibility indicator values.
     """
-    if type(eta) != Tensor:
-        eta = torch.full((len(constraints),), eta)
-    if len(eta) != len(constraints):
-        raise ValueError(
-            "Number of provided constraints and number of provided etas do not match."
-        )
-    if not (eta > 0).all():
+    # a scalar eta is kept as a Python float and broadcast in the division
+    # below, avoiding the allocation and indexing of a length-k tensor
+    if torch.is_tensor(eta):
+        if len(eta) != len(constraints):
+            raise ValueError(
+                "Number of provided constraints and number of provided etas do "
+                "not match."
+            )
+        # a min-reduction is cheaper than materializing a boolean tensor via
+        # (eta > 0).all() and costs the same single synchronization
+        if len(eta) > 0 and eta.min().item() <= 0:
+            raise ValueError("eta must be positive.")
+        # align eta with the samples once here, so that indexing it per
+        # constraint does not trigger host-device transfers later on
+        eta = eta.to(device=samples.device, dtype=samples.dtype, non_blocking=True)
+    elif eta <= 0:
         raise ValueError("eta must be positive.")
-    is_feasible = torch.zeros_like(samples[..., 0])
-    log_sigmoid = log_fatmoid if fat else logexpit
-    for constraint, e in zip(constraints, eta):
-        is_feasible = is_feasible + log_sigmoid(-constraint(samples) / e)
+    if not constraints:
+        is_feasible = torch.zeros_like(samples[..., 0])
+        return is_feasible if log else is_feasible.exp()
+    orig_dtype = samples.dtype
+    if compute_dtype is not None and compute_dtype != orig_dtype:
+        samples = samples.to(dtype=compute_dtype)
+    log_sigmoid = log_fatmoid if fat else logsigmoid
+    if len(constraints) == 1:
+        # fast path for the common single-constraint case, skipping the
+        # stacking and eta broadcasting machinery below
+        e = eta[0] if torch.is_tensor(eta) else eta
+        is_feasible = log_sigmoid(-constraints[0](samples) / e)
+        if is_feasible.dtype != orig_dtype and compute_dtype is not None:
+            is_feasible = is_feasible.to(dtype=orig_dtype)
+        return is_feasible if log else is_feasible.exp()
+    # stacking the constraint values lets the log-sigmoid and the sum over
+    # constraints run as single batched ops rather than one kernel per constraint
+    cvals = torch.stack([constraint(samples) for constraint in constraints], dim=0)
+    if torch.is_tensor(eta):
+        eta = eta.to(cvals).view(-1, *([1] * (cvals.dim() - 1)))
+    if cvals.is_cuda:
+        # on GPU, compiling fuses the neg/div/log-sigmoid/sum/exp chain into a
+        # single kernel; on CPU eager avoids the one-time compilation cost
+        is_feasible = _get_compiled_smoothed_feasibility_core()(cvals, eta, log, fat)
+        if is_feasible.dtype != orig_dtype and compute_dtype is not None:
+            is_feasible = is_feasible.to(dtype=orig_dtype)
+        return is_feasible
+    is_feasible = log_sigmoid(-cvals / eta).sum(dim=0)
+    if is_feasible.dtype != orig_dtype and compute_dtype is not None:
+        is_feasible = is_feasible.to(dtype=orig_dtype)
 
     return is_feasible if log else is_feasible.exp()
 
 
 # TODO: deprecate this function
+_SOFT_EVAL_WARNED = False
+
+
 def soft_eval_constraint(lhs: Tensor, eta: float = 1e-3) -> Tensor:
     r"""Element-wise evaluation of a constraint in a 'soft' fashion
 
@@ -184,14 +308,21 @@ def soft_eval_constraint(lhs: Tensor, eta: float = 1e-3) -> Tensor:
         For each element `x`, `value(x) -> 0` as `x` becomes positive, and
         `value(x) -> 1` as x becomes negative.
     """
-    warnings.warn(
-        "`soft_eval_constraint` is deprecated. Please consider `torch.utils.sigmoid` "
-        + "with its `fat` and `log` options to compute feasibility indicators.",
-        DeprecationWarning,
-    )
+    global _SOFT_EVAL_WARNED
+    if not _SOFT_EVAL_WARNED:
+        # only warn once; this may be called from within tight optimization loops
+        warnings.warn(
+            "`soft_eval_constraint` is deprecated. Please consider "
+            "`torch.utils.sigmoid` with its `fat` and `log` options to compute "
+            "feasibility indicators.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        _SOFT_EVAL_WARNED = True
     if eta <= 0:
         raise ValueError("eta must be positive.")
-    return torch.sigmoid(-lhs / eta)
+    # dividing by -eta folds the sign flip into the division, saving a temporary
+    return torch.sigmoid(lhs.div(-eta))
 
 
 def apply_constraints(
@@ -228,10 +359,13 @@ def apply_constraints(
     """
     # obj has dimensions n_samples x b x q (x m')
     obj = obj.add(infeasible_cost)  # now it is nonnegative
-    obj = apply_constraints_nonnegative_soft(
+    # the shifted obj above is a fresh tensor, so the soft constraint application
+    # and the shift back can safely operate in place, avoiding two more copies
+    return apply_constraints_nonnegative_soft(
         obj=obj,
         constraints=constraints,
         samples=samples,
         eta=eta,
+        copy=False,
+        shift=infeasible_cost,
     )
-    return obj.add(-infeasible_cost)
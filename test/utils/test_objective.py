@@ -8,6 +8,7 @@
 import torch
 from botorch.utils import apply_constraints, get_objective_weights_transform
 from botorch.utils.objective import (
+    apply_constraints_nonnegative_soft,
     compute_feasibility_indicator,
     compute_smoothed_feasibility_indicator,
     soft_eval_constraint,
@@ -176,6 +177,25 @@ class TestApplyConstraints(BotorchTestCase):
                     eta=0.0,
                 )
 
+    def test_apply_constraints_nonnegative_soft_copy(self):
+        tkwargs = {"device": self.device}
+        for dtype in (torch.float, torch.double):
+            tkwargs["dtype"] = dtype
+            samples = torch.rand(3, 2, **tkwargs)
+            obj = samples.clone()
+            out = apply_constraints_nonnegative_soft(
+                obj=obj, constraints=[zeros_f], samples=samples, eta=1e-3
+            )
+            # by default, the input objective is left untouched
+            self.assertTrue(torch.equal(obj, samples))
+            obj = samples.clone()
+            out_inplace = apply_constraints_nonnegative_soft(
+                obj=obj, constraints=[zeros_f], samples=samples, eta=1e-3, copy=False
+            )
+            self.assertTrue(torch.equal(out_inplace, out))
+            # with copy=False, the input objective is modified in place
+            self.assertTrue(torch.equal(obj, out))
+
     def test_apply_constraints_wrong_eta_dim(self):
         tkwargs = {"device": self.device}
         for dtype in (torch.float, torch.double):
@@ -240,6 +260,24 @@ class TestApplyConstraints(BotorchTestCase):
                 eta=torch.tensor([0.1], device=self.device),
             )
 
+    def test_smoothed_feasibility_indicator_compute_dtype(self):
+        samples = torch.rand(4, 2, device=self.device)
+        for constraints in ([nonzeros_f], [nonzeros_f, minus_one_f]):
+            for log in (False, True):
+                expected = compute_smoothed_feasibility_indicator(
+                    constraints=constraints, samples=samples, eta=1e-1, log=log
+                )
+                ind = compute_smoothed_feasibility_indicator(
+                    constraints=constraints,
+                    samples=samples,
+                    eta=1e-1,
+                    log=log,
+                    compute_dtype=torch.bfloat16,
+                )
+                # result is cast back to the dtype of the samples
+                self.assertEqual(ind.dtype, samples.dtype)
+                self.assertAllClose(ind, expected, atol=1e-2, rtol=1e-2)
+
 
 class TestGetObjectiveWeightsTransform(BotorchTestCase):
     def test_NoWeights(self):